@@ -1,20 +1,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Literal, Protocol, cast
+from functools import cache, cached_property, lru_cache
+from itertools import accumulate, islice
+from typing import TYPE_CHECKING, Any, Literal, Protocol
 
-import plotly.express as px
+import numpy as np
 import plotly.graph_objs as go
 
 from ridgeplot._color.colorscale import (
     validate_and_coerce_colorscale,
 )
-from ridgeplot._color.utils import apply_alpha, round_color, to_rgb
+from ridgeplot._color.utils import apply_alpha, round_color, to_rgb, unpack_rgb
 from ridgeplot._types import CollectionL2, Color, ColorScale
-from ridgeplot._utils import get_xy_extrema, normalise_min_max
+from ridgeplot._utils import get_x_extrema
 
 if TYPE_CHECKING:
-    from collections.abc import Collection, Generator
+    from collections.abc import Collection, Sequence
 
     from ridgeplot._types import Densities, Numeric
 
@@ -50,7 +52,7 @@ class InterpolationContext:
 
     @classmethod
     def from_densities(cls, densities: Densities) -> InterpolationContext:
-        x_min, x_max, _, _ = map(float, get_xy_extrema(densities=densities))
+        x_min, x_max = map(float, get_x_extrema(densities=densities))
         return cls(
             densities=densities,
             n_rows=len(densities),
@@ -59,68 +61,108 @@ class InterpolationContext:
             x_max=x_max,
         )
 
+    @cached_property
+    def xy(self) -> list[list[tuple[np.ndarray, np.ndarray]]]:
+        """The densities as contiguous ``float64`` (x, y) column pairs.
+
+        This is computed lazily (and only once) since it is only
+        needed by the colormodes that operate on the density values.
+        """
+        return [
+            [tuple(np.ascontiguousarray(np.asarray(trace, dtype=np.float64).T)) for trace in row]
+            for row in self.densities
+        ]
+
 
 class InterpolationFunc(Protocol):
     def __call__(self, ctx: InterpolationContext) -> ColorscaleInterpolants: ...
 
 
-def _mul(a: tuple[Numeric, ...], b: tuple[Numeric, ...]) -> tuple[Numeric, ...]:
-    """Multiply two tuples element-wise."""
-    return tuple(a_i * b_i for a_i, b_i in zip(a, b))
+def _weighted_mean(x: np.ndarray, y: np.ndarray) -> float:
+    """Compute the mean of ``x`` weighted by ``y``."""
+    y_sum = y.sum()
+    if y_sum == 0:
+        raise ValueError("Can't compute the mean of a density trace whose y values sum to zero.")
+    return float(np.dot(x, y) / y_sum)
+
+
+def _norm(val: Numeric, min_: Numeric, max_: Numeric) -> float:
+    """Unchecked version of :func:`~ridgeplot._utils.normalise_min_max`.
+
+    The caller is responsible for ensuring that ``min_ <= val <= max_`` and
+    ``min_ < max_``, which allows us to skip the validation in hot loops.
+    """
+    return float((val - min_) / (max_ - min_))
+
+
+# Interpolant used when there is only a single row or trace to color. There
+# is nothing to spread over the colorscale, so we use its midpoint instead.
+_SINGLE_INTERPOLANT = 0.5
 
 
 def _interpolate_row_index(ctx: InterpolationContext) -> ColorscaleInterpolants:
+    if ctx.n_rows == 1:
+        return [[_SINGLE_INTERPOLANT] * len(row) for row in ctx.densities]
+    n = ctx.n_rows - 1
+    return [[(n - ith_row) / n] * len(row) for ith_row, row in enumerate(ctx.densities)]
+
+
+def _interpolate_trace_index(ctx: InterpolationContext) -> ColorscaleInterpolants:
+    if ctx.n_traces == 1:
+        return [[_SINGLE_INTERPOLANT] * len(row) for row in ctx.densities]
+    n = ctx.n_traces - 1
+    row_lens = [len(row) for row in ctx.densities]
+    # Index of the first trace in each row
+    offsets = accumulate(row_lens[:-1], initial=0)
     return [
-        [((ctx.n_rows - 1) - ith_row) / (ctx.n_rows - 1)] * len(row)
-        for ith_row, row in enumerate(ctx.densities)
+        [(n - (offset + ith_row_trace)) / n for ith_row_trace in range(row_len)]
+        for offset, row_len in zip(offsets, row_lens)
     ]
 
 
-def _interpolate_trace_index(ctx: InterpolationContext) -> ColorscaleInterpolants:
-    ps = []
-    ith_trace = 0
-    for row in ctx.densities:
-        ps_row = []
-        for _ in row:
-            ps_row.append(((ctx.n_traces - 1) - ith_trace) / (ctx.n_traces - 1))
-            ith_trace += 1
-        ps.append(ps_row)
-    return ps
+def _spread_interpolants(n_traces: int) -> list[float]:
+    """Spread ``n_traces`` interpolants evenly over the colorscale, from 1 to 0."""
+    if n_traces == 1:
+        return [_SINGLE_INTERPOLANT]
+    n = n_traces - 1
+    return [(n - ith_trace) / n for ith_trace in range(n_traces)]
 
 
 def _interpolate_trace_index_row_wise(ctx: InterpolationContext) -> ColorscaleInterpolants:
-    return [
-        [((len(row) - 1) - ith_row_trace) / (len(row) - 1) for ith_row_trace in range(len(row))]
-        for row in ctx.densities
-    ]
+    return [_spread_interpolants(len(row)) for row in ctx.densities]
 
 
 def _interpolate_mean_minmax(ctx: InterpolationContext) -> ColorscaleInterpolants:
-    ps = []
-    for row in ctx.densities:
-        ps_row = []
-        for trace in row:
-            x, y = zip(*trace)
-            ps_row.append(
-                normalise_min_max(sum(_mul(x, y)) / sum(y), min_=ctx.x_min, max_=ctx.x_max)
-            )
-        ps.append(ps_row)
-    return ps
+    # Validate the bounds once here, since _norm() won't do it for us
+    if ctx.x_max <= ctx.x_min:
+        raise ValueError(
+            "The 'mean-minmax' colormode requires the densities to span a non-empty x range. "
+            f"Got x_min={ctx.x_min} and x_max={ctx.x_max} instead."
+        )
+    means = [[_weighted_mean(x, y) for x, y in row] for row in ctx.xy]
+    min_mean = min(min(row) for row in means)
+    max_mean = max(max(row) for row in means)
+    # The means can fall outside of the x range when some y values are negative
+    if min_mean < ctx.x_min or max_mean > ctx.x_max:
+        raise ValueError(
+            "The 'mean-minmax' colormode requires the weighted means of all traces to be "
+            f"within the x range ({ctx.x_min}, {ctx.x_max}). "
+            f"Got min_mean={min_mean} and max_mean={max_mean} instead."
+        )
+    return [[_norm(mean, min_=ctx.x_min, max_=ctx.x_max) for mean in row] for row in means]
 
 
 def _interpolate_mean_means(ctx: InterpolationContext) -> ColorscaleInterpolants:
-    means = []
-    for row in ctx.densities:
-        means_row = []
-        for trace in row:
-            x, y = zip(*trace)
-            means_row.append(sum(_mul(x, y)) / sum(y))
-        means.append(means_row)
-    min_mean = min([min(row) for row in means])
-    max_mean = max([max(row) for row in means])
-    return [
-        [normalise_min_max(mean, min_=min_mean, max_=max_mean) for mean in row] for row in means
-    ]
+    means = [[_weighted_mean(x, y) for x, y in row] for row in ctx.xy]
+    min_mean = min(min(row) for row in means)
+    max_mean = max(max(row) for row in means)
+    # Validate the bounds once here, since _norm() won't do it for us
+    if max_mean <= min_mean:
+        raise ValueError(
+            "The 'mean-means' colormode requires at least two traces with different means. "
+            f"Got min_mean={min_mean} and max_mean={max_mean} instead."
+        )
+    return [[_norm(mean, min_=min_mean, max_=max_mean) for mean in row] for row in means]
 
 
 SOLID_COLORMODE_MAPS: dict[SolidColormode, InterpolationFunc] = {
@@ -132,6 +174,52 @@ SOLID_COLORMODE_MAPS: dict[SolidColormode, InterpolationFunc] = {
 }
 
 
+def _interpolate_rgb_array(
+    scale: Sequence[float], colors: Sequence[Color], ps: np.ndarray
+) -> list[Color]:
+    """Get the colors at all the interpolation points ``ps`` in a single
+    vectorised pass, given a colorscale split into its (sorted) scale values
+    and their colors. Points that don't match any of the scale values are
+    interpolated in rgb space, like :func:`plotly.colors.find_intermediate_color`
+    does."""
+    # NaN values fail both comparisons, so they are rejected as well
+    out_of_bounds = ~((ps >= 0) & (ps <= 1))
+    if out_of_bounds.any():
+        raise ValueError(
+            "The interpolation point 'p' should be a float value between 0 and 1, "
+            f"not {ps[out_of_bounds][0]}."
+        )
+    scale_arr = np.asarray(scale, dtype=np.float64)
+    n = len(scale_arr)
+    # Points that match a scale value exactly map to that value's color.
+    # For repeated scale values (i.e., hard color stops), we pick the first one
+    exact_idx = np.searchsorted(scale_arr, ps, side="left")
+    is_exact = scale_arr[np.minimum(exact_idx, n - 1)] == ps
+    # The colorscale values are sorted in ascending order, so we can use a
+    # binary search to find the surrounding scale values. For repeated scale
+    # values (i.e., hard color stops), we always pick the first occurrence:
+    # - floor_idx: first index of the largest scale value smaller than p
+    # - ceil_idx: first index of the smallest scale value greater than p
+    # The exact matches for p == 0 and p == 1 have no floor and no ceiling,
+    # respectively, but their results are discarded anyway, so we can safely
+    # clip the indices here
+    floor_idx = np.clip(exact_idx - 1, 0, n - 1)
+    floor_idx = np.searchsorted(scale_arr, scale_arr[floor_idx], side="left")
+    ceil_idx = np.minimum(np.searchsorted(scale_arr, ps, side="right"), n - 1)
+    # Only the colors at the ends of the interpolated segments are converted
+    rgb_arr = np.zeros((n, 3), dtype=np.float64)
+    is_interpolated = ~is_exact
+    for i in set(floor_idx[is_interpolated].tolist()) | set(ceil_idx[is_interpolated].tolist()):
+        rgb_arr[i] = unpack_rgb(to_rgb(colors[i]))[:3]
+    t = (ps - scale_arr[floor_idx]) / (scale_arr[ceil_idx] - scale_arr[floor_idx])
+    rgb_floor = rgb_arr[floor_idx]
+    rgb = rgb_floor + t[:, np.newaxis] * (rgb_arr[ceil_idx] - rgb_floor)
+    return [
+        colors[i] if exact else f"rgb({r}, {g}, {b})"
+        for i, exact, (r, g, b) in zip(exact_idx.tolist(), is_exact.tolist(), rgb.tolist())
+    ]
+
+
 def interpolate_color(colorscale: ColorScale, p: float) -> Color:
     """Get a color from a colorscale at a given interpolation point ``p``."""
     if not (0 <= p <= 1):
@@ -140,21 +228,45 @@ def interpolate_color(colorscale: ColorScale, p: float) -> Color:
         )
     scale = [s for s, _ in colorscale]
     colors = [c for _, c in colorscale]
-    if p in scale:
-        return colors[scale.index(p)]
-    colors = [to_rgb(c) for c in colors]
-    ceil = min(filter(lambda s: s > p, scale))
-    floor = max(filter(lambda s: s < p, scale))
-    p_normalised = normalise_min_max(p, min_=floor, max_=ceil)
-    return cast(
-        str,
-        px.colors.find_intermediate_color(
-            lowcolor=colors[scale.index(floor)],
-            highcolor=colors[scale.index(ceil)],
-            intermed=p_normalised,
-            colortype="rgb",
-        ),
-    )
+    return _interpolate_rgb_array(scale, colors, ps=np.asarray([p], dtype=np.float64))[0]
+
+
+def _coerce_colorscale_uncached(
+    colorscale: ColorScale | Collection[Color] | str | None, opacity: float | None
+) -> ColorScale:
+    colorscale = validate_and_coerce_colorscale(colorscale)
+    # Plotly doesn't support setting the opacity for the `fillcolor`
+    # or `fillgradient`, so we need to manually override the colorscale
+    # color values and add the corresponding alpha channel to the colors.
+    if opacity is not None:
+        colorscale = tuple((v, apply_alpha(c, opacity)) for v, c in colorscale)
+    return colorscale
+
+
+_coerce_colorscale_cached = lru_cache(maxsize=32)(_coerce_colorscale_uncached)
+
+
+def _coerce_colorscale(
+    colorscale: ColorScale | Collection[Color] | str | None, opacity: float | None
+) -> ColorScale:
+    """Validate and coerce the colorscale and apply the opacity to its colors.
+
+    The result is cached for hashable colorscales, which avoids repeating
+    this work when plotting several figures with the same colorscale (e.g.,
+    when generating the frames of an animation).
+    """
+    # The default colorscale depends on the active Plotly
+    # template, so we can't cache it based on its value
+    if colorscale is None:
+        return _coerce_colorscale_uncached(colorscale, opacity=opacity)
+    try:
+        key: Any = colorscale if isinstance(colorscale, str) else tuple(colorscale)
+        hash(key)
+    except TypeError:
+        # e.g., colorscales defined as lists of lists. This also lets
+        # invalid colorscale values fail with the usual error message.
+        return _coerce_colorscale_uncached(colorscale, opacity=opacity)
+    return _coerce_colorscale_cached(key, opacity=opacity)
 
 
 def compute_trace_colors(
@@ -162,34 +274,31 @@ def compute_trace_colors(
     colormode: Literal["fillgradient"] | SolidColormode,
     opacity: float | None,
     interpolation_ctx: InterpolationContext,
-) -> Generator[Generator[dict[str, Any]]]:
-    colorscale = validate_and_coerce_colorscale(colorscale)
-
-    # Plotly doesn't support setting the opacity for the `fillcolor`
-    # or `fillgradient`, so we need to manually override the colorscale
-    # color values and add the corresponding alpha channel to the colors.
+) -> list[list[dict[str, Any]]]:
     if opacity is not None:
         opacity = float(opacity)
-        colorscale = [(v, apply_alpha(c, opacity)) for v, c in colorscale]
+    colorscale = _coerce_colorscale(colorscale, opacity=opacity)
 
     if colormode == "fillgradient":
-        return (
-            (
-                dict(
-                    fillgradient=go.scatter.Fillgradient(
-                        colorscale=colorscale,
-                        start=interpolation_ctx.x_min,
-                        stop=interpolation_ctx.x_max,
-                        type="horizontal",
-                    )
-                )
-                for _ in row
+        # The fillgradient is the same for all traces, so
+        # we only need to build (and validate) it once
+        fillgradient = dict(
+            fillgradient=go.scatter.Fillgradient(
+                colorscale=colorscale,
+                start=interpolation_ctx.x_min,
+                stop=interpolation_ctx.x_max,
+                type="horizontal",
             )
-            for row in interpolation_ctx.densities
         )
+        return [[fillgradient] * len(row) for row in interpolation_ctx.densities]
+
+    scale = [s for s, _ in colorscale]
+    colors = [c for _, c in colorscale]
 
-    def _get_fill_color(p: float) -> str:
-        fill_color = interpolate_color(colorscale, p=p)
+    # Many traces share the same color (e.g., all traces in a row for
+    # the "row-index" colormode), so we cache the post-processing step
+    @cache
+    def _get_fill_color(fill_color: Color) -> str:
         if opacity is not None:
             # Sometimes the interpolation logic can drop the alpha channel
             fill_color = apply_alpha(fill_color, alpha=opacity)
@@ -206,4 +315,13 @@ def compute_trace_colors(
         )
     interpolate_func = SOLID_COLORMODE_MAPS[colormode]
     interpolants = interpolate_func(ctx=interpolation_ctx)
-    return ((dict(fillcolor=_get_fill_color(p)) for p in row) for row in interpolants)
+    # Interpolate all the colors at once and then split them back into rows
+    ps = np.fromiter((p for row in interpolants for p in row), dtype=np.float64)
+    fill_colors = iter(_interpolate_rgb_array(scale, colors, ps=ps))
+    return [
+        [
+            dict(fillcolor=_get_fill_color(fill_color))
+            for fill_color in islice(fill_colors, len(row))
+        ]
+        for row in interpolants
+    ]
@@ -6,10 +6,12 @@ from typing import (
     TypeVar,
 )
 
+import numpy as np
+
 if TYPE_CHECKING:
     from typing import Any
 
-    from ridgeplot._types import CollectionL2, Densities, Numeric
+    from ridgeplot._types import CollectionL2, Densities, DensityTrace, Numeric
 
 
 def get_xy_extrema(densities: Densities) -> tuple[Numeric, Numeric, Numeric, Numeric]:
@@ -47,14 +49,95 @@ def get_xy_extrema(densities: Densities) -> tuple[Numeric, Numeric, Numeric, Num
     """
     if len(densities) == 0:
         raise ValueError("The densities array should not be empty.")
-    x_flat: list[Numeric] = []
-    y_flat: list[Numeric] = []
-    for row in densities:
-        for trace in row:
-            for x, y in trace:
-                x_flat.append(x)
-                y_flat.append(y)
-    return min(x_flat), max(x_flat), min(y_flat), max(y_flat)
+    traces = (trace for row in densities for trace in row if len(trace) != 0)
+    first_trace = next(traces, None)
+    if first_trace is None:
+        raise ValueError("The densities array should contain at least one non-empty trace.")
+    x_min, x_max, y_min, y_max = _get_trace_xy_extrema(first_trace)
+    # Fold each trace's extrema into the running global extrema,
+    # instead of materialising a flat buffer with all the points.
+    for trace in traces:
+        trace_x_min, trace_x_max, trace_y_min, trace_y_max = _get_trace_xy_extrema(trace)
+        x_min = min(x_min, trace_x_min)
+        x_max = max(x_max, trace_x_max)
+        y_min = min(y_min, trace_y_min)
+        y_max = max(y_max, trace_y_max)
+    return x_min, x_max, y_min, y_max
+
+
+def _get_trace_xy_extrema(trace: DensityTrace) -> tuple[Any, Any, Any, Any]:
+    """Get the x-y extrema (x_min, x_max, y_min, y_max) of a single trace.
+
+    Traces that are already numpy arrays are reduced over their column views.
+    Converting other collections (e.g., the lists of tuples returned by
+    :func:`~ridgeplot._kde.estimate_densities`) to arrays is more expensive
+    than the reductions themselves, so their points are unpacked in Python.
+    In both cases, traces whose points aren't (x, y) pairs fail to unpack.
+    """
+    if isinstance(trace, np.ndarray):
+        x, y = trace.T
+        return x.min(), x.max(), y.min(), y.max()
+    x = [x for x, _ in trace]
+    y = [y for _, y in trace]
+    return min(x), max(x), min(y), max(y)
+
+
+def get_x_extrema(densities: Densities) -> tuple[Numeric, Numeric]:
+    r"""Get the global x extrema (x_min, x_max) over all
+    :data:`~ridgeplot._types.DensityTrace`\s in the
+    :data:`~ridgeplot._types.Densities` array.
+
+    Same as :func:`get_xy_extrema`, but the y values are never reduced.
+
+    Parameters
+    ----------
+    densities
+        A :data:`~ridgeplot._types.Densities` array.
+
+    Returns
+    -------
+    Tuple[Numeric, Numeric]
+        A tuple of the form (x_min, x_max).
+
+    Examples
+    --------
+    >>> get_x_extrema(
+    ...     [
+    ...         [
+    ...             [(0, 0), (1, 1), (2, 2), (3, 3)],
+    ...             [(0, 0), (1, 1), (2, 2)],
+    ...         ],
+    ...         [
+    ...             [(-2, 2), (-1, 1), (0, 1)],
+    ...         ],
+    ...     ]
+    ... )
+    (-2, 3)
+    """
+    if len(densities) == 0:
+        raise ValueError("The densities array should not be empty.")
+    traces = (trace for row in densities for trace in row if len(trace) != 0)
+    first_trace = next(traces, None)
+    if first_trace is None:
+        raise ValueError("The densities array should contain at least one non-empty trace.")
+    x_min, x_max = _get_trace_x_extrema(first_trace)
+    for trace in traces:
+        trace_x_min, trace_x_max = _get_trace_x_extrema(trace)
+        x_min = min(x_min, trace_x_min)
+        x_max = max(x_max, trace_x_max)
+    return x_min, x_max
+
+
+def _get_trace_x_extrema(trace: DensityTrace) -> tuple[Any, Any]:
+    """Get the x extrema (x_min, x_max) of a single trace.
+
+    Same as :func:`_get_trace_xy_extrema`, but the y values are never reduced.
+    """
+    if isinstance(trace, np.ndarray):
+        x, _ = trace.T
+        return x.min(), x.max()
+    x = [x for x, _ in trace]
+    return min(x), max(x)
 
 
 def normalise_min_max(val: Numeric, min_: Numeric, max_: Numeric) -> float:
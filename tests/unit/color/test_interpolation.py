@@ -2,18 +2,25 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
 
 from ridgeplot import ridgeplot
 from ridgeplot._color.interpolation import (
     InterpolationContext,
+    _coerce_colorscale,
+    _coerce_colorscale_cached,
     _interpolate_mean_means,
     _interpolate_mean_minmax,
+    _interpolate_rgb_array,
+    _interpolate_trace_index,
     interpolate_color,
 )
+from ridgeplot._color.utils import to_rgb
 
 if TYPE_CHECKING:
-    from ridgeplot._types import ColorScale
+    from ridgeplot._color.interpolation import InterpolationFunc, SolidColormode
+    from ridgeplot._types import ColorScale, Densities
 
 
 def test_colormode_invalid() -> None:
@@ -34,6 +41,80 @@ def test_colormode_trace_index_row_wise() -> None:
     assert fig.data[3].fillcolor == fig.data[7].fillcolor == "rgb(100, 100, 100)"
 
 
+@pytest.mark.parametrize("colormode", ["row-index", "trace-index", "trace-index-row-wise"])
+def test_colormode_index_single_trace(colormode: SolidColormode) -> None:
+    fig = ridgeplot(
+        samples=[[1, 2, 3]],
+        colorscale=(
+            (0.0, "rgb(100, 100, 100)"),
+            (1.0, "rgb(200, 200, 200)"),
+        ),
+        colormode=colormode,
+    )
+    assert fig.data[1].fillcolor == "rgb(150.0, 150.0, 150.0)"
+
+
+def test_colormode_trace_index_row_wise_single_trace_row() -> None:
+    fig = ridgeplot(
+        samples=[[[1, 2, 3], [4, 5, 6]], [[7, 8, 9]]],
+        colorscale=(
+            (0.0, "rgb(100, 100, 100)"),
+            (1.0, "rgb(200, 200, 200)"),
+        ),
+        colormode="trace-index-row-wise",
+    )
+    assert fig.data[1].fillcolor == "rgb(200, 200, 200)"
+    assert fig.data[3].fillcolor == "rgb(100, 100, 100)"
+    assert fig.data[5].fillcolor == "rgb(150.0, 150.0, 150.0)"
+
+
+def test_interpolation_context_from_densities() -> None:
+    ctx = InterpolationContext.from_densities(
+        [
+            [[(0, 1), (1, 2), (2, 1)], [(2, 2), (3, 4)]],
+            [[(-4, 1), (5, 6), (6, 1)]],
+        ]
+    )
+    assert ctx.n_rows == 2
+    assert ctx.n_traces == 3
+    assert ctx.x_min == -4.0
+    assert ctx.x_max == 6.0
+
+
+def test_interpolation_context_from_densities_fails_for_empty_densities() -> None:
+    with pytest.raises(ValueError, match="The densities array should not be empty"):
+        InterpolationContext.from_densities([])
+
+
+def test_interpolation_context_xy() -> None:
+    ctx = InterpolationContext.from_densities(
+        [
+            [[(0, 1), (1, 2), (2, 1)], [(2, 2), (3, 4)]],
+            [[(4, 1), (5, 6), (6, 1)]],
+        ]
+    )
+    assert [[(x.tolist(), y.tolist()) for x, y in row] for row in ctx.xy] == [
+        [([0.0, 1.0, 2.0], [1.0, 2.0, 1.0]), ([2.0, 3.0], [2.0, 4.0])],
+        [([4.0, 5.0, 6.0], [1.0, 6.0, 1.0])],
+    ]
+    x, y = ctx.xy[0][0]
+    assert x.dtype == y.dtype == np.float64
+    assert x.flags.c_contiguous
+    assert y.flags.c_contiguous
+
+
+def test_interpolate_trace_index() -> None:
+    ctx = InterpolationContext.from_densities(
+        [
+            [[(0, 1), (1, 2)], [(1, 2), (2, 1)]],
+            [[(2, 2), (3, 4)]],
+            [[(4, 1), (5, 6)], [(5, 6), (6, 1)]],
+        ]
+    )
+    ps = _interpolate_trace_index(ctx)
+    assert ps == [[1.0, 0.75], [0.5], [0.25, 0.0]]
+
+
 def test_interpolate_mean_minmax() -> None:
     ctx = InterpolationContext.from_densities(
         [
@@ -46,6 +127,41 @@ def test_interpolate_mean_minmax() -> None:
     assert ps == [[1 / 6], [3 / 6], [5 / 6]]
 
 
+def test_interpolate_mean_minmax_fails_for_empty_x_range() -> None:
+    ctx = InterpolationContext.from_densities(
+        [
+            [[(1, 1), (1, 2)]],
+            [[(1, 1), (1, 3)]],
+        ]
+    )
+    with pytest.raises(ValueError, match="requires the densities to span a non-empty x range"):
+        _interpolate_mean_minmax(ctx)
+
+
+def test_interpolate_mean_minmax_fails_for_out_of_bounds_means() -> None:
+    ctx = InterpolationContext.from_densities(
+        [
+            # Weighted mean of -8, due to the negative y value
+            [[(0, 2), (1, 1), (2, -2.5)]],
+            [[(0, 1), (1, 2), (2, 1)]],
+        ]
+    )
+    with pytest.raises(ValueError, match="weighted means of all traces to be within the x range"):
+        _interpolate_mean_minmax(ctx)
+
+
+@pytest.mark.parametrize("interpolate_func", [_interpolate_mean_minmax, _interpolate_mean_means])
+def test_interpolate_mean_fails_for_zero_density(interpolate_func: InterpolationFunc) -> None:
+    ctx = InterpolationContext.from_densities(
+        [
+            [[(0, 1), (1, 2), (2, 1)]],
+            [[(2, 0), (3, 0), (4, 0)]],
+        ]
+    )
+    with pytest.raises(ValueError, match="y values sum to zero"):
+        interpolate_func(ctx=ctx)
+
+
 def test_interpolate_mean_means() -> None:
     ctx = InterpolationContext.from_densities(
         [
@@ -58,6 +174,19 @@ def test_interpolate_mean_means() -> None:
     assert ps == [[0.0], [0.5], [1.0]]
 
 
+@pytest.mark.parametrize(
+    "densities",
+    [
+        [[[(0, 1), (1, 2), (2, 1)]]],
+        [[[(0, 1), (1, 2), (2, 1)]], [[(0, 1), (1, 2), (2, 1)]]],
+    ],
+)
+def test_interpolate_mean_means_fails_for_equal_means(densities: Densities) -> None:
+    ctx = InterpolationContext.from_densities(densities)
+    with pytest.raises(ValueError, match="requires at least two traces with different means"):
+        _interpolate_mean_means(ctx)
+
+
 # ==============================================================
 # ---  interpolate_color()
 # ==============================================================
@@ -74,7 +203,75 @@ def test_interpolate_color_p_not_in_scale(viridis_colorscale: ColorScale) -> Non
     assert interpolate_color(colorscale=viridis_colorscale, p=0.5) == "rgb(34.5, 144.0, 139.5)"
 
 
+def test_interpolate_color_repeated_scale_values() -> None:
+    colorscale = [
+        (0.0, "rgb(0, 0, 0)"),
+        (0.5, "rgb(100, 100, 100)"),
+        (0.5, "rgb(200, 200, 200)"),
+        (1.0, "rgb(250, 250, 250)"),
+    ]
+    assert interpolate_color(colorscale=colorscale, p=0.25) == "rgb(50.0, 50.0, 50.0)"
+    assert interpolate_color(colorscale=colorscale, p=0.5) == "rgb(100, 100, 100)"
+    assert interpolate_color(colorscale=colorscale, p=0.75) == "rgb(175.0, 175.0, 175.0)"
+
+
 @pytest.mark.parametrize("p", [-10.0, -1.3, 1.9, 100.0])
 def test_interpolate_color_fails_for_p_out_of_bounds(p: float) -> None:
     with pytest.raises(ValueError, match="should be a float value between 0 and 1"):
         interpolate_color(colorscale=..., p=p)  # type: ignore[arg-type]
+
+
+# ==============================================================
+# ---  _interpolate_rgb_array()
+# ==============================================================
+
+
+def test_interpolate_rgb_array_matches_interpolate_color(viridis_colorscale: ColorScale) -> None:
+    scale = [s for s, _ in viridis_colorscale]
+    rgb_colors = [to_rgb(c) for _, c in viridis_colorscale]
+    ps = np.linspace(0, 1, 57)
+    expected = [to_rgb(interpolate_color(colorscale=viridis_colorscale, p=p)) for p in ps]
+    assert _interpolate_rgb_array(scale, rgb_colors, ps=ps) == expected
+
+
+def test_interpolate_rgb_array_repeated_scale_values() -> None:
+    scale = [0.0, 0.5, 0.5, 1.0]
+    rgb_colors = ["rgb(0, 0, 0)", "rgb(100, 100, 100)", "rgb(200, 200, 200)", "rgb(250, 250, 250)"]
+    ps = np.asarray([0.0, 0.25, 0.5, 0.75, 1.0])
+    assert _interpolate_rgb_array(scale, rgb_colors, ps=ps) == [
+        "rgb(0, 0, 0)",
+        "rgb(50.0, 50.0, 50.0)",
+        "rgb(100, 100, 100)",
+        "rgb(175.0, 175.0, 175.0)",
+        "rgb(250, 250, 250)",
+    ]
+
+
+@pytest.mark.parametrize("p", [-0.5, 1.5, float("nan")])
+def test_interpolate_rgb_array_fails_for_p_out_of_bounds(p: float) -> None:
+    scale = [0.0, 1.0]
+    rgb_colors = ["rgb(0, 0, 0)", "rgb(250, 250, 250)"]
+    ps = np.asarray([0.0, p, 1.0])
+    with pytest.raises(ValueError, match=f"should be a float value between 0 and 1, not {p}"):
+        _interpolate_rgb_array(scale, rgb_colors, ps=ps)
+
+
+# ==============================================================
+# ---  _coerce_colorscale()
+# ==============================================================
+
+
+def test_coerce_colorscale_is_cached() -> None:
+    _coerce_colorscale_cached.cache_clear()
+    colorscale = [(0.0, "red"), (1.0, "blue")]
+    first = _coerce_colorscale(colorscale, opacity=0.5)
+    assert first == ((0.0, "rgba(255, 0, 0, 0.5)"), (1.0, "rgba(0, 0, 255, 0.5)"))
+    assert _coerce_colorscale(colorscale, opacity=0.5) is first
+    assert _coerce_colorscale_cached.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("colorscale", [None, [[0.0, "red"], [1.0, "blue"]]])
+def test_coerce_colorscale_not_cached(colorscale: ColorScale | None) -> None:
+    _coerce_colorscale_cached.cache_clear()
+    assert _coerce_colorscale(colorscale, opacity=None)
+    assert _coerce_colorscale_cached.cache_info().currsize == 0
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from itertools import product
-from typing import TYPE_CHECKING, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 import numpy as np
 import pytest
 
-from ridgeplot._utils import get_xy_extrema, normalise_min_max
+from ridgeplot._utils import get_x_extrema, get_xy_extrema, normalise_min_max
 
 if TYPE_CHECKING:
 
@@ -28,15 +28,25 @@ class TestGetXYExtrema:
         with pytest.raises(ValueError, match="The densities array should not be empty"):
             get_xy_extrema(densities=[])
 
-    def test_raise_for_non_2d_array(self) -> None:
+    @pytest.mark.parametrize("densities", [[[]], [[], []], [[[]], [[]]]])
+    def test_raise_for_no_non_empty_traces(self, densities: Densities) -> None:
+        with pytest.raises(ValueError, match="should contain at least one non-empty trace"):
+            get_xy_extrema(densities=densities)
+
+    def test_skips_empty_traces(self) -> None:
+        densities: Densities = [[[], [(1, 2), (3, 4)]], [[(0, 5)], []]]
+        assert get_xy_extrema(densities) == (0, 3, 2, 5)
+
+    @pytest.mark.parametrize("trace_type", [list, np.asarray])
+    def test_raise_for_non_2d_array(self, trace_type: Callable[[Any], Any]) -> None:
         # Fails if one of the arrays is not 2D
         with pytest.raises(ValueError, match=r"too many values to unpack \(expected 2\)"):
             get_xy_extrema(
                 densities=[
                     # valid 2D trace
-                    [[(0, 0), (1, 1), (2, 2)]],
+                    [trace_type([(0, 0), (1, 1), (2, 2)])],
                     # invalid 3D trace
-                    [[(3, 3, 3), (4, 4, 4)]],  # type: ignore[list-item]
+                    [trace_type([(3, 3, 3), (4, 4, 4)])],
                 ]
             )
 
@@ -90,6 +100,34 @@ class TestGetXYExtrema:
         assert get_xy_extrema(densities) == expected
 
 
+class TestGetXExtrema:
+    """Tests for the :func:`ridgeplot._utils.get_x_extrema` function"""
+
+    def test_raise_for_empty_sequence(self) -> None:
+        with pytest.raises(ValueError, match="The densities array should not be empty"):
+            get_x_extrema(densities=[])
+
+    def test_raise_for_no_non_empty_traces(self) -> None:
+        with pytest.raises(ValueError, match="should contain at least one non-empty trace"):
+            get_x_extrema(densities=[[], [[]]])
+
+    def test_expected_output(self) -> None:
+        densities: Densities = [
+            [[(1, 1), (2, 2), (3, 3)], [], [(2, 2), (36, 3), (4, 62)]],
+            [np.asarray([(2, 0), (3, 1)])],
+        ]
+        assert get_x_extrema(densities) == (1, 36)
+        assert get_x_extrema(densities) == get_xy_extrema(densities)[:2]
+
+    def test_preserves_element_types(self) -> None:
+        densities: Densities = [[[(1, 2.5), (3, 0.5)]]]
+        x_min, x_max = get_x_extrema(densities)
+        assert (x_min, x_max) == (1, 3)
+        assert isinstance(x_min, int)
+        assert isinstance(x_max, int)
+        assert get_x_extrema(densities) == get_xy_extrema(densities)[:2]
+
+
 class TestNormaliseMinMax:
     """Tests for the :func:`ridgeplot._utils.normalise_min_max` function."""
 